@@ -1,10 +1,23 @@
-from six import StringIO, BytesIO
-
-import gzip
 import sys
+import zlib
 
 import brotli
 
+try:
+  from isal import isal_zlib
+  ACCELERATED_GZIP = True # SIMD accelerated Intel ISA-L
+except ImportError:
+  ACCELERATED_GZIP = False
+
+# isal_zlib mirrors the zlib decompressobj interface so
+# both share the same member, padding, and error handling
+if ACCELERATED_GZIP:
+  GUNZIP_BACKEND = isal_zlib
+  GUNZIP_ERRORS = (zlib.error, isal_zlib.error)
+else:
+  GUNZIP_BACKEND = zlib
+  GUNZIP_ERRORS = (zlib.error,)
+
 from .exceptions import DecompressionError, CompressionError
 from .lib import yellow
 
@@ -70,16 +83,13 @@ def compress(content, method='gzip', compress_level=None):
 def gzip_compress(content, compresslevel=None):
   if compresslevel is None:
     compresslevel = 9
-  
-  stringio = BytesIO()
-  gzip_obj = gzip.GzipFile(mode='wb', fileobj=stringio, compresslevel=compresslevel)
 
   if sys.version_info < (3,):
     content = str(content)
 
-  gzip_obj.write(content)
-  gzip_obj.close()
-  return stringio.getvalue()
+  # wbits = 16 + MAX_WBITS writes a gzip rather than zlib container
+  compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+  return compressor.compress(content) + compressor.flush()
 
 def gunzip(content):
   """ 
@@ -92,14 +102,24 @@ def gunzip(content):
     raise DecompressionError('File contains zero bytes.')
 
   gzip_magic_numbers = [ 0x1f, 0x8b ]
-  first_two_bytes = [ byte for byte in bytearray(content)[:2] ]
+  first_two_bytes = [ byte for byte in bytearray(content[:2]) ]
   if first_two_bytes != gzip_magic_numbers:
     raise DecompressionError('File is not in gzip format. Magic numbers {}, {} did not match {}, {}.'.format(
       hex(first_two_bytes[0]), hex(first_two_bytes[1])), hex(gzip_magic_numbers[0]), hex(gzip_magic_numbers[1]))
 
-  stringio = BytesIO(content)
-  with gzip.GzipFile(mode='rb', fileobj=stringio) as gfile:
-    return gfile.read()
+  chunks = []
+  while content:
+    decompressor = GUNZIP_BACKEND.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+      chunks.append(decompressor.decompress(content))
+    except GUNZIP_ERRORS as err: # e.g. bad crc, corrupt blocks, trailing garbage
+      raise DecompressionError(str(err))
+    if not getattr(decompressor, 'eof', True): # eof is python 3 only
+      raise DecompressionError('Compressed file ended before the end-of-stream marker was reached.')
+    # concatenated gzip members and trailing zero padding are permitted
+    content = decompressor.unused_data.lstrip(b'\x00')
+
+  return b''.join(chunks)
 
 def brotli_compress(content, quality=None):
   if quality is None:
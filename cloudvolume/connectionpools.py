@@ -4,11 +4,18 @@ import time
 from functools import partial
 
 import boto3 
+import botocore.config
 from google.cloud.storage import Client
 import tenacity
 
 from .secrets import google_credentials, aws_credentials
 from .exceptions import UnsupportedProtocolError
+from .threaded_queue import DEFAULT_THREADS
+
+# botocore defaults to 10 pooled HTTP connections per client.
+# A client used by more threads than that discards and then
+# re-handshakes connections ("Connection pool is full").
+S3_MAX_POOL_CONNECTIONS = max(50, DEFAULT_THREADS * 2)
 
 retry = tenacity.retry(
   reraise=True, 
@@ -101,6 +108,7 @@ class S3ConnectionPool(ConnectionPool):
         aws_access_key_id=self.credentials['AWS_ACCESS_KEY_ID'],
         aws_secret_access_key=self.credentials['AWS_SECRET_ACCESS_KEY'],
         region_name='us-east-1',
+        config=botocore.config.Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS),
       )
     elif self.service == 'matrix':
       return boto3.client(
@@ -108,6 +116,7 @@ class S3ConnectionPool(ConnectionPool):
         aws_access_key_id=self.credentials['AWS_ACCESS_KEY_ID'],
         aws_secret_access_key=self.credentials['AWS_SECRET_ACCESS_KEY'],
         endpoint_url='https://s3-hpcrc.rc.princeton.edu',
+        config=botocore.config.Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS),
       )
     else:
       raise UnsupportedProtocolError("{} unknown. Choose from 's3' or 'matrix'.", self.service)
@@ -1,13 +1,13 @@
-import posixpath
+import functools
 from collections import namedtuple
 import json
 import re
-import requests
-from six.moves import urllib
+from six.moves.urllib.parse import urlsplit
 
 from ... import exceptions
 from ... import paths
 from ...secrets import chunkedgraph_credentials
+from ...storage import storage_interfaces
 from ..precomputed import PrecomputedMetadata
 
 VERSION_ORDERING = [  
@@ -17,33 +17,42 @@ VERSION_MAP = {
   version: i for i, version in enumerate(VERSION_ORDERING)
 }
 
-class GrapheneApiVersion():
+def make_auth_header(token):
+  return {
+    "Authorization": "Bearer %s" % token
+  }
+
+DEFAULT_AUTH_HEADER = make_auth_header(
+  chunkedgraph_credentials.get("token") if chunkedgraph_credentials else None
+)
+
+@functools.total_ordering
+class GrapheneApiVersion(object):
+  __slots__ = ('version', '_seq')
+
   def __init__(self, version):
     self.version = version.lower()
     if self.version == 'table':
       self.version = VERSION_ORDERING[-1]
     elif self.version not in VERSION_MAP:
       raise ValueError("Unknown Graphene API version {}".format(self.version))
+    self._seq = VERSION_MAP[self.version]
 
   def __eq__(self, rhs):
     return self.version == rhs.version
-  def __ne__(self, rhs):
+  def __ne__(self, rhs): # python 2 does not derive this from __eq__
     return self.version != rhs.version
   def __lt__(self, rhs):
-    return self.sequence_number() < rhs.sequence_number()
-  def __gt__(self, rhs):
-    return self.sequence_number() > rhs.sequence_number()
-  def __le__(self, rhs):
-    return self.sequence_number() <= rhs.sequence_number()
-  def __ge__(self, rhs):
-    return self.sequence_number() >= rhs.sequence_number()
+    return self._seq < rhs._seq
+  def __hash__(self):
+    return hash(self.version)
   def __str__(self):
     return self.version
   def __repr__(self):
     return "GrapheneApiVersion('{}')".format(self.version)
 
   def sequence_number(self):
-    return VERSION_MAP[self.version]
+    return self._seq
 
   def path(self, graphene_path):
     if self.version == '1.0':
@@ -51,11 +60,11 @@ class GrapheneApiVersion():
     return self.api_vx_path(graphene_path)
 
   def table_path(self, graphene_path):
-    return posixpath.join(graphene_path.modality, 'table', graphene_path.dataset)
+    return graphene_path.modality + '/table/' + graphene_path.dataset
 
   def legacy_path(self, graphene_path):
     """All /segmentation/1.0/$DATASET paths"""
-    return posixpath.join(graphene_path.modality, '1.0', graphene_path.dataset)
+    return graphene_path.modality + '/1.0/' + graphene_path.dataset
 
   def api_vx_path(self, graphene_path):
     """
@@ -63,26 +72,31 @@ class GrapheneApiVersion():
 
     As of Feb. 2020, these were the latest paths.
     """
-    return posixpath.join( 
-      graphene_path.modality, 'api', self.version, 'table', graphene_path.dataset
+    return (
+      graphene_path.modality + '/api/' + self.version + '/table/' + graphene_path.dataset
     )
 
 class GrapheneMetadata(PrecomputedMetadata):
   def __init__(self, cloudpath, use_https=False, use_auth=True, auth_token=None, *args, **kwargs):
     self.server_url = cloudpath.replace('graphene://', '')
     self.server_path = extract_graphene_path(self.server_url)
+    self._base_path = self._compute_base_path()
+    self._table_path = (
+      self._base_path + self.server_path.modality + '/table/' + self.server_path.dataset
+    )
+    self._info_path = self._table_path + '/info'
+    self._supported_api_versions = None
+    self._supported_version_strings = frozenset()
+    self._supported_api_versions_src = None
     self.use_https = use_https
     self.auth_header = None
     self.spatial_index = None
     if use_auth:
-      token = None
-      if chunkedgraph_credentials:
-        token = chunkedgraph_credentials["token"]
       if auth_token:
-        token = auth_token
-      self.auth_header = {
-        "Authorization": "Bearer %s" % token
-      }
+        self.auth_header = make_auth_header(auth_token)
+      else:
+        # copy so per-volume edits can't leak into other volumes
+        self.auth_header = dict(DEFAULT_AUTH_HEADER)
     super(GrapheneMetadata, self).__init__(cloudpath, *args, **kwargs)
 
     version = self.server_path.version
@@ -90,40 +104,58 @@ class GrapheneMetadata(PrecomputedMetadata):
       version = self.supported_api_versions[-1].version
 
     self.api_version = GrapheneApiVersion(version)
+    self._manifest_endpoint = self._compute_manifest_endpoint()
 
   def supports_api(self, version):
-    return GrapheneApiVersion(version) in self.supported_api_versions
+    version = str(version).lower()
+    if version == 'table':
+      version = VERSION_ORDERING[-1]
+    self._update_supported_api_versions()
+    return version in self._supported_version_strings
 
   @property  
   def supported_api_versions(self):
-    versions = [ 
-      GrapheneApiVersion(VERSION_ORDERING[i]) \
-      for i in self.info['app']['supported_api_versions'] 
-    ]
+    self._update_supported_api_versions()
+    return self._supported_api_versions
+
+  def _update_supported_api_versions(self):
+    """Rebuilt only when the listed versions change."""
+    src = tuple(self.info['app']['supported_api_versions'])
+    if self._supported_api_versions_src == src:
+      return
+
+    versions = [ GrapheneApiVersion(VERSION_ORDERING[i]) for i in src ]
     versions.sort(key=lambda ver: ver.sequence_number())
-    return versions
+    self._supported_api_versions = tuple(versions)
+    self._supported_version_strings = frozenset([ ver.version for ver in versions ])
+    self._supported_api_versions_src = src
 
-  @property
-  def base_path(self):
+  def _compute_base_path(self):
     path = self.server_path
     if path.subdomain is None:
       return path.scheme + '://' + path.domain + '/'   
     return path.scheme + '://' + path.subdomain + '.' + path.domain + '/' 
 
+  @property
+  def base_path(self):
+    return self._base_path
+
   @property
   def table_path(self):
-    return posixpath.join(self.base_path, self.server_path.modality, 'table', self.server_path.dataset)
+    return self._table_path
 
   @property
   def info_path(self):
     """e.g. https://SUBDOMAIN.dynamicannotationframework.com/segmentation/table/DATASET/info"""
-    return posixpath.join(self.table_path, 'info')
+    return self._info_path
 
   def fetch_info(self):
     """
     Reads info from chunkedgraph endpoint and extracts relevant information
     """
-    r = requests.get(self.info_path, headers=self.auth_header)
+    # the shared keep-alive session is recreated by 
+    # reset_connection_pools, so look it up on each call
+    r = storage_interfaces.HTTP_SESSION.get(self.info_path, headers=self.auth_header)
     r.raise_for_status()
     return r.json()
 
@@ -157,8 +189,7 @@ class GrapheneMetadata(PrecomputedMetadata):
     # TODO: add this as new parameter to the info as it can be different from the chunkedgraph chunksize
     return self.graph_chunk_size
 
-  @property
-  def manifest_endpoint(self):
+  def _compute_manifest_endpoint(self):
     pth = self.server_path
     pth = GraphenePath(
       pth.scheme, pth.subdomain, pth.domain, 
@@ -166,7 +197,11 @@ class GrapheneMetadata(PrecomputedMetadata):
     )
 
     url = self.api_version.path(pth)
-    return posixpath.join(self.base_path, url, 'manifest')
+    return self.base_path + url + '/manifest'
+
+  @property
+  def manifest_endpoint(self):
+    return self._manifest_endpoint
 
   @property
   def chunks_start_at_voxel_offset(self):
@@ -174,23 +209,20 @@ class GrapheneMetadata(PrecomputedMetadata):
     Boolean property specifying whether ChunkedGraph chunks begin
     at voxel offset or at origin.
     """
-    if 'chunks_start_at_voxel_offset' in self.info:
-      return self.info["chunks_start_at_voxel_offset"]
-    return False
+    return self.info.get("chunks_start_at_voxel_offset", False)
 
   @property
   def mesh_metadata(self):
-    if 'mesh_metadata' in self.info:
-      return self.info["mesh_metadata"]
-    return None
+    return self.info.get("mesh_metadata", None)
 
   @property
   def uniform_draco_grid_size(self):
     """
     If not None, a number that specifies the draco_grid_size at every ChunkedGraph level.
     """
-    if self.mesh_metadata and 'uniform_draco_grid_size' in self.mesh_metadata:
-      return self.mesh_metadata["uniform_draco_grid_size"]
+    mesh_metadata = self.mesh_metadata
+    if mesh_metadata:
+      return mesh_metadata.get("uniform_draco_grid_size", None)
     return None
 
   @property
@@ -198,31 +230,37 @@ class GrapheneMetadata(PrecomputedMetadata):
     """
     The highest level in the ChunkedGraph that we create meshes for in this dataset.
     """
-    if self.mesh_metadata and 'max_meshed_layer' in self.mesh_metadata:
-      return self.mesh_metadata["max_meshed_layer"]
+    mesh_metadata = self.mesh_metadata
+    if mesh_metadata:
+      return mesh_metadata.get("max_meshed_layer", None)
     return None
 
   def get_draco_grid_size(self, level):
     """
     Returns the draco_grid_size for specified ChunkedGraph level.
     """
-    if self.mesh_metadata is None:
+    mesh_metadata = self.mesh_metadata
+    if mesh_metadata is None:
       raise ValueError('This layer is not draco meshed')
-    if self.uniform_draco_grid_size is not None:
-      return self.uniform_draco_grid_size
-    if self.mesh_metadata["max_meshed_layer"] < level:
+    uniform_draco_grid_size = mesh_metadata.get("uniform_draco_grid_size", None)
+    if uniform_draco_grid_size is not None:
+      return uniform_draco_grid_size
+    if mesh_metadata["max_meshed_layer"] < level:
       raise ValueError(
         "Request level",
         level,
         ". But the maximum meshed level is ",
-        self.mesh_metadata["max_meshed_layer"],
+        mesh_metadata["max_meshed_layer"],
       )
-    return self.mesh_metadata["draco_grid_sizes"][str(level)]
+    return mesh_metadata["draco_grid_sizes"][str(level)]
 
 GraphenePath = namedtuple('GraphenePath', ('scheme', 'subdomain', 'domain', 'modality', 'version', 'dataset'))
 LEGACY_EXTRACTION_RE = re.compile(r'/?(\w+)/([\d\.]+)/([\w\d\.\_\-]+)/?')
 API_VX_EXTRACTION_RE = re.compile(r'/?(\w+)/api/(v[\d\.]+)/([\w\d\.\_\-]+)/?')
 LATEST_API_EXTRACTION_RE = re.compile(r'/?(\w+)/(table)/([\w\d\.\_\-]+)/?')
+GRAPHENE_PATH_SCHEMES = ( 
+  LATEST_API_EXTRACTION_RE, API_VX_EXTRACTION_RE, LEGACY_EXTRACTION_RE 
+)
 
 def extract_graphene_path(url):
   """
@@ -234,16 +272,11 @@ def extract_graphene_path(url):
   Latest endpoint:
     graphene://https://SUBDOMAIN.DOMAIN_DOT_COM/segmentation/table/DATASET
   """
-  parse = urllib.parse.urlparse(url)
-  subdomain = parse.netloc.split('.')[0]
-  domain = '.'.join(parse.netloc.split('.')[1:])
-
-  schemes = [ 
-    LATEST_API_EXTRACTION_RE, API_VX_EXTRACTION_RE, LEGACY_EXTRACTION_RE 
-  ]
+  parse = urlsplit(url)
+  subdomain, _, domain = parse.netloc.partition('.')
 
-  for scheme in schemes:
-    match = re.match(scheme, parse.path)
+  for scheme in GRAPHENE_PATH_SCHEMES:
+    match = scheme.match(parse.path)
     if match:
       break
   else:
@@ -200,10 +200,20 @@ class CloudVolumeGraphene(CloudVolumePrecomputed):
   def get_chunk_layer(self, node_or_chunk_id):
     """
     Extract Layer from Node ID or Chunk ID
-    
-    Returns: (int) layer number
+
+    node_or_chunk_id: int or a list, tuple, or ndarray of ints. 
+      Sequences are decoded in a single vectorized numpy operation.
+
+    Returns: (int) layer number or (np.uint64 array) layer numbers
     """
-    return int(int(node_or_chunk_id) >> (64 - self.meta.n_bits_for_layer_id))
+    layer_shift = 64 - self.meta.n_bits_for_layer_id
+
+    if isinstance(node_or_chunk_id, (list, tuple, np.ndarray)) \
+      and np.ndim(node_or_chunk_id) > 0:
+      ids = np.asarray(node_or_chunk_id, dtype=np.uint64)
+      return ids >> np.uint64(layer_shift)
+
+    return int(int(node_or_chunk_id) >> layer_shift)
 
   def get_root(self, segid, *args, **kwargs):
     """Deprecated. Get a single root id for a single segid."""
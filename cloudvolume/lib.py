@@ -139,6 +139,11 @@ def scatter(sequence, n):
   for i in range(n):
     yield sequence[i::n]
 
+def sip(sequence, block_size):
+  """Splits ``sequence`` into contiguous blocks of at most ``block_size``. Returns generator."""
+  for i in range(0, len(sequence), block_size):
+    yield sequence[i:i+block_size]
+
 def xyzrange(start_vec, end_vec=None, stride_vec=(1,1,1)):
   if end_vec is None:
     end_vec = start_vec
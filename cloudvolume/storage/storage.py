@@ -2,6 +2,7 @@ import six
 from six.moves import queue as Queue
 from collections import defaultdict
 import json
+import math
 import os.path
 import posixpath
 import re
@@ -11,7 +12,7 @@ from tqdm import tqdm
 
 from cloudvolume import compression
 from cloudvolume.exceptions import UnsupportedProtocolError
-from cloudvolume.lib import mkdir, scatter, jsonify
+from cloudvolume.lib import mkdir, scatter, sip, jsonify
 from cloudvolume.threaded_queue import ThreadedQueue, DEFAULT_THREADS
 from cloudvolume.scheduler import schedule_green_jobs
 
@@ -19,7 +20,8 @@ import cloudvolume.paths
 
 from .storage_interfaces import (
   FileInterface, HttpInterface, 
-  S3Interface, GoogleCloudStorageInterface
+  S3Interface, GoogleCloudStorageInterface,
+  MIN_LIST_SIZE
 )
 
 def get_interface_class(protocol):
@@ -54,8 +56,14 @@ class StorageBase(object):
     return posixpath.join(self._layer_path, file_path)
 
   def put_json(self, file_path, content, content_type='application/json', *args, **kwargs):
-    if type(content) != str:
-      content = jsonify(content)
+    """
+    Serialize content as compact JSON and upload it as UTF-8 bytes. 
+    Content that is already a str or bytes is assumed to be serialized.
+    """
+    if not isinstance(content, (six.binary_type, six.text_type)):
+      content = jsonify(content, separators=(',', ':'))
+    if isinstance(content, six.text_type):
+      content = content.encode('utf8')
     return self.put_file(file_path, content, content_type=content_type, *args, **kwargs)
     
   def get_json(self, file_path):
@@ -136,7 +144,10 @@ class SimpleStorage(StorageBase):
     Required:
       files: [ (filepath, content), .... ]
     """
-    for path, content in tqdm(files, disable=(not self.progress), desc="Uploading"):
+    if self.progress:
+      files = tqdm(files, desc="Uploading")
+
+    for path, content in files:
       content = compression.compress(content, method=compress, compress_level=compress_level)
       self._interface.put_file(path, content, content_type, compress, cache_control=cache_control)
     return self
@@ -165,8 +176,11 @@ class SimpleStorage(StorageBase):
     return content
 
   def get_files(self, file_paths):
+    if self.progress:
+      file_paths = tqdm(file_paths, desc="Downloading")
+
     results = []
-    for path in tqdm(file_paths, disable=(not self.progress), desc="Downloading"):
+    for path in file_paths:
       error = None 
 
       try:
@@ -187,8 +201,7 @@ class SimpleStorage(StorageBase):
     self._interface.delete_file(file_path)
 
   def delete_files(self, file_paths):
-    for path in file_paths:
-      self._interface.delete_file(path)
+    self._interface.delete_files(file_paths)
     return self
 
   def list_files(self, prefix="", flat=False):
@@ -445,9 +458,29 @@ class ThreadedStorage(StorageBase, ThreadedQueue):
   """
   def __init__(self, layer_path, n_threads=20, progress=False):
     StorageBase.__init__(self, layer_path, progress)
-    ThreadedQueue.__init__(self, n_threads)
+    # Threads are started by the first put, including inside a 
+    # with statement (StorageBase.__enter__ precedes ThreadedQueue's 
+    # in the MRO), so that instances used only for single file 
+    # operations don't spin up and tear down a pool of idle threads.
+    ThreadedQueue.__init__(self, 0)
+    self._n_threads = n_threads
     self._interface = self.get_connection()
 
+  def _block_size(self, num_paths):
+    """
+    Size of the contiguous blocks that batched operations hand to 
+    each worker. Aim for several blocks per thread so idle threads 
+    pick up the slack behind a slow one, but keep blocks large 
+    enough for interfaces that list (S3) or batch (S3, GCS) them.
+    """
+    block_size = int(math.ceil(num_paths / (4.0 * self._n_threads)))
+    return max(block_size, MIN_LIST_SIZE)
+
+  def put(self, fn):
+    if not self._threads:
+      self.start_threads(self._n_threads)
+    return ThreadedQueue.put(self, fn)
+
   def _initialize_interface(self):
     return self._interface_cls(self._path)
 
@@ -464,11 +497,6 @@ class ThreadedStorage(StorageBase, ThreadedQueue):
 
   def get_path_to_file(self, file_path):
     return posixpath.join(self._layer_path, file_path)
-
-  def put_json(self, file_path, content, content_type='application/json', *args, **kwargs):
-    if type(content) != str:
-      content = jsonify(content)
-    return self.put_file(file_path, content, content_type=content_type, *args, **kwargs)
   
   def put_file(self, file_path, content, content_type=None, compress=None, compress_level=None, cache_control=None):
     """ 
@@ -492,14 +520,20 @@ class ThreadedStorage(StorageBase, ThreadedQueue):
     Required:
       files: [ (filepath, content), .... ]
     """
+    if compress not in compression.COMPRESSION_TYPES:
+      raise NotImplementedError()
+
+    # compress in the worker threads so that encoding 
+    # overlaps with uploading rather than serializing 
+    # on the calling thread
     def base_uploadfn(path, content, interface):
+      content = compression.compress(content, method=compress, compress_level=compress_level)
       interface.put_file(path, content, content_type, compress, cache_control=cache_control)
 
     for path, content in files:
-      content = compression.compress(content, method=compress, compress_level=compress_level)
       uploadfn = partial(base_uploadfn, path, content)
 
-      if len(self._threads):
+      if self._n_threads:
         self.put(uploadfn)
       else:
         uploadfn(self._interface)
@@ -527,8 +561,8 @@ class ThreadedStorage(StorageBase, ThreadedQueue):
     def exist_thunk(paths, interface):
       results.update(interface.files_exist(paths))
 
-    if len(self._threads):
-      for block in scatter(file_paths, len(self._threads)):
+    if self._n_threads:
+      for block in sip(file_paths, self._block_size(len(file_paths))):
         self.put(partial(exist_thunk, block))
     else:
       exist_thunk(file_paths, self._interface)
@@ -575,7 +609,7 @@ class ThreadedStorage(StorageBase, ThreadedQueue):
       })
 
     for path in file_paths:
-      if len(self._threads):
+      if self._n_threads:
         self.put(partial(get_file_thunk, path))
       else:
         get_file_thunk(path, self._interface)
@@ -590,7 +624,7 @@ class ThreadedStorage(StorageBase, ThreadedQueue):
     def thunk_delete(interface):
       interface.delete_file(file_path)
 
-    if len(self._threads):
+    if self._n_threads:
       self.put(thunk_delete)
     else:
       thunk_delete(self._interface)
@@ -599,14 +633,15 @@ class ThreadedStorage(StorageBase, ThreadedQueue):
 
   def delete_files(self, file_paths):
 
-    def thunk_delete(path, interface):
-      interface.delete_file(path)
+    def thunk_delete(paths, interface):
+      interface.delete_files(paths)
 
-    for path in file_paths:
-      if len(self._threads):
-        self.put(partial(thunk_delete, path))
-      else:
-        thunk_delete(path, self._interface)
+    if self._n_threads:
+      file_paths = list(file_paths)
+      for block in sip(file_paths, self._block_size(len(file_paths))):
+        self.put(partial(thunk_delete, block))
+    else:
+      thunk_delete(file_paths, self._interface)
 
     desc = 'Deleting' if self.progress else None
     self.wait(desc)
@@ -1,9 +1,11 @@
 import six
+from six.moves import http_cookiejar
 from collections import defaultdict
 import json
 import os.path
 import posixpath
 import re
+import threading
 
 import boto3
 import botocore
@@ -15,9 +17,14 @@ import tenacity
 
 from cloudvolume.connectionpools import S3ConnectionPool, GCloudBucketPool
 from cloudvolume.lib import mkdir
+from cloudvolume.threaded_queue import DEFAULT_THREADS
 from cloudvolume.exceptions import UnsupportedCompressionType
 
 COMPRESSION_EXTENSIONS = ('.gz', '.br')
+TEXT_CONTENT_TYPE_RE = re.compile('json|te?xt')
+# Fewest keys for which S3Interface.files_exist lists 
+# the key range instead of issuing one HEAD per key.
+MIN_LIST_SIZE = 32
 
 # This is just to support pooling by bucket
 class keydefaultdict(defaultdict):
@@ -29,15 +36,50 @@ class keydefaultdict(defaultdict):
       return ret
 
 S3_POOL = None
+S3_CLIENTS = None
 GC_POOL = None
+HTTP_SESSION = None
+S3_CLIENTS_LOCK = threading.Lock()
 def reset_connection_pools():
   global S3_POOL
+  global S3_CLIENTS
   global GC_POOL
+  global HTTP_SESSION
   S3_POOL = keydefaultdict(lambda service: keydefaultdict(lambda bucket_name: S3ConnectionPool(service, bucket_name)))
+  S3_CLIENTS = {}
   GC_POOL = keydefaultdict(lambda bucket_name: GCloudBucketPool(bucket_name))
 
+  # Shared for its pooled keep-alive connections (the urllib3 
+  # pool is thread safe). Callers pass headers and auth per 
+  # request, and the cookie policy refuses every Set-Cookie so 
+  # one response can't attach credentials to later requests.
+  HTTP_SESSION = requests.Session()
+  HTTP_SESSION.cookies.set_policy(
+    http_cookiejar.DefaultCookiePolicy(allowed_domains=[])
+  )
+  adapter = requests.adapters.HTTPAdapter(pool_maxsize=DEFAULT_THREADS)
+  HTTP_SESSION.mount('http://', adapter)
+  HTTP_SESSION.mount('https://', adapter)
+
 reset_connection_pools()
 
+def shared_s3_client(service, bucket):
+  """
+  boto3 clients are thread safe, so every S3Interface 
+  for a given bucket in this process shares one client 
+  rather than checking a separate one out of the pool.
+  """
+  key = (service, bucket)
+  try:
+    return S3_CLIENTS[key]
+  except KeyError:
+    pass
+
+  with S3_CLIENTS_LOCK:
+    if key not in S3_CLIENTS:
+      S3_CLIENTS[key] = S3_POOL[service][bucket].get_connection()
+    return S3_CLIENTS[key]
+
 retry = tenacity.retry(
   reraise=True, 
   stop=tenacity.stop_after_attempt(7), 
@@ -56,11 +98,11 @@ class FileInterface(StorageInterface):
   def __init__(self, path):
     super(StorageInterface, self).__init__()
     self._path = path
+    # joined once; get_path_to_file is called per file
+    self._prefix = os.path.join(self._path.basepath, self._path.layer, '')
 
   def get_path_to_file(self, file_path):
-    return os.path.join(
-      self._path.basepath, self._path.layer, file_path
-    )
+    return self._prefix + file_path
 
   def put_file(
     self, file_path, content, 
@@ -77,9 +119,9 @@ class FileInterface(StorageInterface):
       path += '.gz'
 
     if content \
+      and type(content) is str \
       and content_type \
-      and re.search('json|te?xt', content_type) \
-      and type(content) is str:
+      and TEXT_CONTENT_TYPE_RE.search(content_type):
 
       content = content.encode('utf-8')
 
@@ -154,21 +196,45 @@ class FileInterface(StorageInterface):
     if len(remove) and remove[-1] != '/':
       remove += '/'
 
-    if flat:
+    # every listed path begins with remove, so slice it off
+    remove_len = len(remove)
+
+    if flat and hasattr(os, 'scandir'):
+      # scandir avoids glob's pattern matching and usually 
+      # answers is_file from the dirent without a stat call
+      subdir = os.path.join(layer_path, os.path.dirname(prefix))
+      basename = os.path.basename(prefix)
+      show_hidden = basename.startswith('.') # match glob
+      try:
+        entries = os.scandir(subdir)
+      except OSError: # e.g. the directory doesn't exist
+        entries = iter(())
+      try:
+        for entry in entries:
+          if not entry.name.startswith(basename):
+            continue
+          elif entry.name[0] == '.' and not show_hidden:
+            continue
+          elif not entry.is_file():
+            continue
+          filenames.append(entry.path[remove_len:])
+      finally:
+        # release the directory handle even if is_file raises
+        if hasattr(entries, 'close'): # python 3.6+
+          entries.close()
+    elif flat: # python 2
       for file_path in glob(path):
         if not os.path.isfile(file_path):
           continue
-        filename = file_path.replace(remove, '')
-        filenames.append(filename)
+        filenames.append(file_path[remove_len:])
     else:
       subdir = os.path.join(layer_path, os.path.dirname(prefix))
       for root, dirs, files in os.walk(subdir):
-        files = [ os.path.join(root, f) for f in files ]
-        files = [ f.replace(remove, '') for f in files ]
-        files = [ f for f in files if f[:len(prefix)] == prefix ]
-        
-        for filename in files:
-          filenames.append(filename)
+        root = os.path.join(root, '')[remove_len:]
+        for f in files:
+          filename = root + f
+          if filename.startswith(prefix):
+            filenames.append(filename)
     
     def stripext(fname):
       (base, ext) = os.path.splitext(fname)
@@ -178,7 +244,8 @@ class FileInterface(StorageInterface):
         return fname
 
     filenames = list(map(stripext, filenames))
-    return _radix_sort(filenames).__iter__()
+    filenames.sort()
+    return iter(filenames)
 
 class GoogleCloudStorageInterface(StorageInterface):
   def __init__(self, path):
@@ -186,9 +253,10 @@ class GoogleCloudStorageInterface(StorageInterface):
     global GC_POOL
     self._path = path
     self._bucket = GC_POOL[path.bucket].get_connection()
+    self._prefix = posixpath.join(self._path.no_bucket_basepath, self._path.layer, '')
 
   def get_path_to_file(self, file_path):
-    return posixpath.join(self._path.no_bucket_basepath, self._path.layer, file_path)
+    return self._prefix + file_path
 
   @retry
   def put_file(self, file_path, content, content_type, compress, cache_control=None):
@@ -259,14 +327,19 @@ class GoogleCloudStorageInterface(StorageInterface):
   def delete_files(self, file_paths):
     MAX_BATCH_SIZE = Batch._MAX_BATCH_SIZE
 
+    file_paths = list(file_paths)
     for i in range(0, len(file_paths), MAX_BATCH_SIZE):
-      try:
-        with self._bucket.client.batch():
-          for file_path in file_paths[i : i + MAX_BATCH_SIZE]:
-            key = self.get_path_to_file(file_path)
-            self._bucket.delete_blob(key)
-      except google.cloud.exceptions.NotFound:
-        pass
+      self._delete_batch(file_paths[i : i + MAX_BATCH_SIZE])
+
+  @retry
+  def _delete_batch(self, file_paths):
+    try:
+      with self._bucket.client.batch():
+        for file_path in file_paths:
+          key = self.get_path_to_file(file_path)
+          self._bucket.delete_blob(key)
+    except google.cloud.exceptions.NotFound:
+      pass
 
   @retry
   def list_files(self, prefix, flat=False):
@@ -279,13 +352,15 @@ class GoogleCloudStorageInterface(StorageInterface):
     """
     layer_path = self.get_path_to_file("")        
     path = posixpath.join(layer_path, prefix)
+    # listed names all begin with path, and so with layer_path
+    layer_path_len, path_len = len(layer_path), len(path)
     for blob in self._bucket.list_blobs(prefix=path):
-      filename = blob.name.replace(layer_path, '')
+      filename = blob.name[layer_path_len:]
       if not filename:
         continue
       elif not flat and filename[-1] != '/':
         yield filename
-      elif flat and '/' not in blob.name.replace(path, ''):
+      elif flat and '/' not in blob.name[path_len:]:
         yield filename
 
   def release_connection(self):
@@ -296,12 +371,13 @@ class HttpInterface(StorageInterface):
   def __init__(self, path):
     super(StorageInterface, self).__init__()
     self._path = path
+    self._prefix = (
+      self._path.protocol + '://' 
+      + posixpath.join(self._path.basepath, self._path.layer, '')
+    )
 
   def get_path_to_file(self, file_path):
-    path = posixpath.join(
-      self._path.basepath, self._path.layer, file_path
-    )
-    return self._path.protocol + '://' + path
+    return self._prefix + file_path
 
   # @retry
   def delete_file(self, file_path):
@@ -322,9 +398,9 @@ class HttpInterface(StorageInterface):
       start = int(start) if start is not None else ''
       end = int(end - 1) if end is not None else ''
       headers = { "Range": "bytes={}-{}".format(start, end) }
-      resp = requests.get(key, headers=headers)
+      resp = HTTP_SESSION.get(key, headers=headers)
     else:
-      resp = requests.get(key)
+      resp = HTTP_SESSION.get(key)
     if resp.status_code in (404, 403):
       return None, None
     resp.raise_for_status()
@@ -340,7 +416,7 @@ class HttpInterface(StorageInterface):
   @retry
   def exists(self, file_path):
     key = self.get_path_to_file(file_path)
-    resp = requests.get(key, stream=True)
+    resp = HTTP_SESSION.get(key, stream=True)
     resp.close()
     return resp.ok
 
@@ -353,12 +429,12 @@ class HttpInterface(StorageInterface):
 class S3Interface(StorageInterface):
   def __init__(self, path):
     super(StorageInterface, self).__init__()
-    global S3_POOL
     self._path = path
-    self._conn = S3_POOL[path.protocol][path.bucket].get_connection()
+    self._conn = shared_s3_client(path.protocol, path.bucket)
+    self._prefix = posixpath.join(self._path.no_bucket_basepath, self._path.layer, '')
 
   def get_path_to_file(self, file_path):
-    return posixpath.join(self._path.no_bucket_basepath, self._path.layer, file_path)
+    return self._prefix + file_path
 
   @retry
   def put_file(self, file_path, content, content_type, compress, cache_control=None, ACL="bucket-owner-full-control"):
@@ -430,7 +506,69 @@ class S3Interface(StorageInterface):
     return exists
 
   def files_exist(self, file_paths):
-    return {path: self.exists(path) for path in file_paths}
+    """
+    For large requests, list the key range spanned by file_paths
+    (up to 1000 keys per request) rather than issuing one HEAD
+    per file. If the range turns out to be much denser than the 
+    request, fall back to HEAD for whatever hasn't been listed yet.
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) < MIN_LIST_SIZE:
+      return {path: self.exists(path) for path in file_paths}
+
+    keys = { self.get_path_to_file(path): path for path in file_paths }
+    ordered = sorted(keys)
+    first_key, last_key = ordered[0], ordered[-1]
+
+    result = {path: False for path in file_paths}
+
+    @retry
+    def s3lst(continuation_token=None):
+      kwargs = {
+        'Bucket': self._path.bucket,
+        'Prefix': posixpath.commonprefix(ordered),
+      }
+
+      if continuation_token:
+        kwargs['ContinuationToken'] = continuation_token
+      else:
+        # StartAfter is exclusive, a proper prefix sorts just before
+        kwargs['StartAfter'] = first_key[:-1]
+
+      try:
+        return self._conn.list_objects_v2(**kwargs)
+      except botocore.exceptions.ClientError as err:
+        # Credentials may allow HEAD but not s3:ListBucket. 
+        # Returning rather than raising skips the retries.
+        if err.response['Error']['Code'] in ('AccessDenied', '403'):
+          return None
+        raise
+
+    # Each listing must replace at least MIN_LIST_SIZE HEADs to pay off
+    max_listings = len(ordered) // MIN_LIST_SIZE
+    listed_to = ''
+    continuation_token = None
+
+    for _ in range(max_listings):
+      resp = s3lst(continuation_token)
+      if resp is None:
+        break
+
+      for item in resp.get('Contents', []):
+        key = item['Key']
+        if key in keys:
+          result[keys[key]] = True
+        listed_to = key
+
+      if listed_to >= last_key or not resp['IsTruncated']:
+        return result
+      continuation_token = resp['NextContinuationToken']
+
+    for key in ordered:
+      if key > listed_to:
+        result[keys[key]] = self.exists(keys[key])
+
+    return result
 
   @retry
   def delete_file(self, file_path):
@@ -451,8 +589,33 @@ class S3Interface(StorageInterface):
     )
 
   def delete_files(self, file_paths):
-    for path in file_paths:
-      self.delete_file(path)
+    MAX_BATCH_SIZE = 1000 # S3 limit for delete_objects
+
+    file_paths = list(file_paths)
+    for i in range(0, len(file_paths), MAX_BATCH_SIZE):
+      self._delete_batch(file_paths[i:i+MAX_BATCH_SIZE])
+
+  def _delete_batch(self, file_paths):
+    keys = [ self.get_path_to_file(path) for path in file_paths ]
+    resp = self._delete_objects(keys)
+
+    # Quiet mode only reports failures. Retry each of those 
+    # once so that a persistent failure raises its own error.
+    for error in resp.get('Errors', []):
+      self._conn.delete_object(
+        Bucket=self._path.bucket,
+        Key=error['Key'],
+      )
+
+  @retry
+  def _delete_objects(self, keys):
+    return self._conn.delete_objects(
+      Bucket=self._path.bucket,
+      Delete={
+        'Objects': [ { 'Key': key } for key in keys ],
+        'Quiet': True,
+      },
+    )
 
   def list_files(self, prefix, flat=False):
     """
@@ -480,16 +643,19 @@ class S3Interface(StorageInterface):
 
     resp = s3lst()
 
+    # listed keys all begin with path, and so with layer_path
+    layer_path_len, path_len = len(layer_path), len(path)
+
     def iterate(resp):
       if 'Contents' not in resp.keys():
         resp['Contents'] = []
 
       for item in resp['Contents']:
         key = item['Key']
-        filename = key.replace(layer_path, '')
+        filename = key[layer_path_len:]
         if not flat and filename[-1] != '/':
           yield filename
-        elif flat and '/' not in key.replace(path, ''):
+        elif flat and '/' not in key[path_len:]:
           yield filename
 
 
@@ -501,24 +667,3 @@ class S3Interface(StorageInterface):
 
       for filename in iterate(resp):
         yield filename
-
-  def release_connection(self):
-    global S3_POOL
-    S3_POOL[self._path.protocol][self._path.bucket].release_connection(self._conn)
-
-
-def _radix_sort(L, i=0):
-  """
-  Most significant char radix sort
-  """
-  if len(L) <= 1: 
-    return L
-  done_bucket = []
-  buckets = [ [] for x in range(255) ]
-  for s in L:
-    if i >= len(s):
-      done_bucket.append(s)
-    else:
-      buckets[ ord(s[i]) ].append(s)
-  buckets = [ _radix_sort(b, i + 1) for b in buckets ]
-  return done_bucket + [ b for blist in buckets for b in blist ]
\ No newline at end of file
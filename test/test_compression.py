@@ -1,4 +1,5 @@
 import pytest
+import sys
 
 import numpy as np
 
@@ -40,4 +41,39 @@ def test_compress_level(compression_method):
     compr_rate.append(float(len(compressed)) / float(len(content)))
 
   # make sure we get better compression at highest level than lowest level
-  assert compr_rate[-1] < compr_rate[0]
\ No newline at end of file
+  assert compr_rate[-1] < compr_rate[0]
+
+@pytest.mark.skipif(sys.version_info < (3, 0), reason="requires python3 or higher")
+def test_gzip_interop():
+  import gzip
+
+  content = np.arange(10000, dtype=np.uint32).tobytes()
+
+  assert gzip.decompress(compress(content, 'gzip')) == content
+  assert decompress(gzip.compress(content), 'gzip') == content
+
+  # concatenated members are valid gzip
+  stream = gzip.compress(content) + gzip.compress(b'tail')
+  assert decompress(stream, 'gzip') == content + b'tail'
+
+  try:
+    decompress(gzip.compress(content)[:100], 'gzip')
+    assert False
+  except DecompressionError:
+    pass
+
+  # zero padding after the last member is tolerated
+  assert decompress(gzip.compress(content) + b'\x00' * 8, 'gzip') == content
+
+  corrupt_crc = bytearray(gzip.compress(content))
+  corrupt_crc[-8] ^= 0xff
+  corrupt_blocks = bytearray(gzip.compress(content))
+  corrupt_blocks[20:40] = b'\xff' * 20
+  trailing_garbage = gzip.compress(content) + b'garbage'
+
+  for bad in (bytes(corrupt_crc), bytes(corrupt_blocks), trailing_garbage):
+    try:
+      decompress(bad, 'gzip')
+      assert False
+    except DecompressionError:
+      pass
@@ -243,6 +243,127 @@ def test_gcv(graphene_vol):
     assert cutout_sv.shape == (5,5,5,1)
     assert graphene_vol[0,0,0].shape == (1,1,1,1)
 
+def test_get_chunk_layer(graphene_vol):
+    assert graphene_vol.get_chunk_layer(TEST_SEG_ID) == 9
+    assert graphene_vol.get_chunk_layer(0) == 0
+
+    labels = np.array([ TEST_SEG_ID, 0, 1 << 56, 1 << 57 ], dtype=np.uint64)
+    layers = graphene_vol.get_chunk_layer(labels)
+    assert layers.dtype == np.uint64
+    assert np.all(layers == [ 9, 0, 1, 2 ])
+    assert np.all(graphene_vol.get_chunk_layer(labels.tolist()) == layers)
+
+    layer = graphene_vol.get_chunk_layer(np.uint64(TEST_SEG_ID))
+    assert type(layer) is int and layer == 9
+    layer = graphene_vol.get_chunk_layer(np.array(TEST_SEG_ID, dtype=np.uint64))
+    assert type(layer) is int and layer == 9
+
+
+def test_fetch_info_drops_cookies():
+    from six.moves import BaseHTTPServer
+    import threading
+    from cloudvolume.datasource.graphene.metadata import GrapheneMetadata
+
+    received = []
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append(self.headers.get('Cookie'))
+            body = b'{}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Set-Cookie', 'middle_auth_token=USER_A; Path=/')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        cloudpath = "graphene://http://127.0.0.1:{}/segmentation/table/{}".format(
+            server.server_address[1], TEST_DATASET_NAME
+        )
+        info = { "app": { "supported_api_versions": [ 0, 1 ] } }
+        meta_a = GrapheneMetadata(cloudpath, auth_token='A', info=info, provenance={})
+        meta_b = GrapheneMetadata(cloudpath, auth_token='B', info=info, provenance={})
+        meta_a.fetch_info()
+        meta_b.fetch_info()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert received == [ None, None ]
+
+def test_supported_api_versions(cv_supervoxels, requests_mock):
+    info_d = {
+        "app": { "supported_api_versions": [ 1, 0 ] },
+        "data_dir": cv_supervoxels,
+        "data_type": "uint64",
+        "graph": { "chunk_size": [64, 64, 64] },
+        "num_channels": 1,
+        "scales": [
+            {
+                "chunk_sizes": [ [32, 32, 32] ],
+                "encoding": "raw",
+                "key": "4_4_40",
+                "resolution": [4, 4, 40],
+                "size": [64, 64, 64],
+                "voxel_offset": [0, 0, 0]
+            }
+        ],
+        "type": "segmentation"
+    }
+    infourl = posixpath.join(PCG_LOCATION, 'segmentation/table', TEST_DATASET_NAME, "info")
+    requests_mock.get(infourl, json=info_d)
+
+    cloudpath = "graphene://" + posixpath.join(PCG_LOCATION, 'segmentation/table', TEST_DATASET_NAME)
+    gcv = cloudvolume.CloudVolume(cloudpath)
+
+    versions = [ str(ver) for ver in gcv.meta.supported_api_versions ]
+    assert versions == [ '1.0', 'v1' ]
+    assert str(gcv.meta.api_version) == 'v1'
+    assert gcv.meta.supports_api('v1')
+    assert gcv.meta.supports_api('1.0')
+    assert gcv.meta.supports_api('V1')
+    assert gcv.meta.supports_api('table')
+
+    gcv.meta.info['app']['supported_api_versions'].remove(1)
+    assert not gcv.meta.supports_api('v1')
+    assert [ str(ver) for ver in gcv.meta.supported_api_versions ] == [ '1.0' ]
+
+    gcv.meta.info['app'] = { 'supported_api_versions': [ 1 ] }
+    assert gcv.meta.supports_api('v1')
+    assert not gcv.meta.supports_api('1.0')
+    assert [ str(ver) for ver in gcv.meta.supported_api_versions ] == [ 'v1' ]
+    assert gcv.meta.info_path == infourl
+    assert gcv.meta.manifest_endpoint == posixpath.join(
+        PCG_LOCATION, 'meshing/api/v1/table', TEST_DATASET_NAME, 'manifest'
+    )
+
+
+def test_extract_graphene_path():
+    from cloudvolume.datasource.graphene.metadata import (
+        extract_graphene_path, GraphenePath
+    )
+
+    path = extract_graphene_path("https://sub.example.com/segmentation/1.0/dataset")
+    assert path == GraphenePath('https', 'sub', 'example.com', 'segmentation', '1.0', 'dataset')
+
+    path = extract_graphene_path("https://sub.example.com/segmentation/api/v1/dataset/")
+    assert path == GraphenePath('https', 'sub', 'example.com', 'segmentation', 'v1', 'dataset')
+
+    path = extract_graphene_path("http://localhost/meshing/table/dataset")
+    assert path == GraphenePath('http', 'localhost', '', 'meshing', 'table', 'dataset')
+
+    with pytest.raises(cloudvolume.exceptions.UnsupportedFormatError):
+        extract_graphene_path("https://sub.example.com/dataset")
+
 
 def faces_to_edges(faces, return_index=False):
     """
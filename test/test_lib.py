@@ -36,6 +36,11 @@ def test_find_closest_divisor():
   size = lib.find_closest_divisor( (73,73,73), (64,64,64) )
   assert tuple(size) == (73,73,73)
 
+def test_sip():
+  assert list(lib.sip([], 3)) == []
+  assert list(lib.sip([1,2,3,4,5,6,7], 3)) == [ [1,2,3], [4,5,6], [7] ]
+  assert list(lib.sip([1,2,3], 5)) == [ [1,2,3] ]
+
 def test_bbox_subvoxel():
   bbox = Bbox( (0,0,0), (1,1,1), dtype=np.float32)
   
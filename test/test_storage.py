@@ -5,7 +5,7 @@ import pytest
 import re
 import time
 
-from cloudvolume.storage import Storage
+from cloudvolume.storage import Storage, SimpleStorage
 from cloudvolume import exceptions, Bbox, chunks
 from layer_harness import delete_layer, TEST_NUMBER
 
@@ -270,6 +270,28 @@ def test_exists():
       assert not s.exists('doesntexist')
       s.delete_file('info')
 
+def test_threads_start_lazily():
+  url = "file:///tmp/removeme/lazy_threads-" + str(TEST_NUMBER)
+  s = Storage(url, n_threads=5)
+  assert not s.are_threads_alive()
+  assert not s.exists('info')
+  assert not s.are_threads_alive()
+
+  s.put_files([ ('info', b'some_string') ])
+  assert len(s._threads) == 5
+  assert s.get_file('info') == b'some_string'
+  s.delete_file('info')
+  s.kill_threads()
+
+  with Storage(url, n_threads=5) as s:
+    assert not s.are_threads_alive()
+    s.put_file('info', b'some_string')
+    assert len(s._threads) == 5
+  assert not s.are_threads_alive()
+  
+  with Storage(url, n_threads=5) as s:
+    s.delete_file('info')
+
 def test_access_non_cannonical_paths():
   urls = [
     "file:///tmp/noncanon",
@@ -288,4 +310,131 @@ def test_access_non_cannonical_paths():
       assert s.get_file('info') == content
       assert s.get_file('nonexistentfile') is None
       s.delete_file('info')
-      s.wait()
\ No newline at end of file
+      s.wait()
+class StubS3Client(object):
+  """Just enough of a boto3 S3 client to exercise S3Interface."""
+  def __init__(self, keys, page_size=1000, can_list=True, failing_deletes=()):
+    self.keys = set(keys)
+    self.page_size = page_size
+    self.can_list = can_list
+    self.failing_deletes = set(failing_deletes)
+    self.calls = []
+
+  def _error(self, code, operation):
+    import botocore.exceptions
+    return botocore.exceptions.ClientError({ 'Error': { 'Code': code } }, operation)
+
+  def head_object(self, Bucket, Key):
+    self.calls.append('head_object')
+    if Key not in self.keys:
+      raise self._error('404', 'HeadObject')
+    return {}
+
+  def list_objects_v2(self, Bucket, Prefix, StartAfter='', ContinuationToken=None):
+    self.calls.append('list_objects_v2')
+    if not self.can_list:
+      raise self._error('AccessDenied', 'ListObjectsV2')
+
+    start = ContinuationToken or StartAfter
+    listed = sorted(
+      key for key in self.keys 
+      if key.startswith(Prefix) and key > start
+    )
+    page = listed[:self.page_size]
+    resp = {
+      'Contents': [ { 'Key': key } for key in page ],
+      'IsTruncated': len(listed) > self.page_size,
+    }
+    if resp['IsTruncated']:
+      resp['NextContinuationToken'] = page[-1]
+    return resp
+
+  def delete_objects(self, Bucket, Delete):
+    self.calls.append(len(Delete['Objects']))
+    keys = [ obj['Key'] for obj in Delete['Objects'] ]
+    errors = [ { 'Key': key, 'Code': 'InternalError' } for key in keys if key in self.failing_deletes ]
+    self.keys -= set(keys) - self.failing_deletes
+    return { 'Errors': errors } if errors else {}
+
+  def delete_object(self, Bucket, Key):
+    self.calls.append('delete_object')
+    self.keys.discard(Key)
+
+@pytest.fixture
+def stub_s3(monkeypatch):
+  from cloudvolume.storage import storage_interfaces
+
+  def install(client):
+    monkeypatch.setitem(storage_interfaces.S3_CLIENTS, ('s3', 'stub-bucket'), client)
+    return client
+
+  return install
+
+S3_STUB_LAYER = 's3://stub-bucket/dataset/layer'
+
+@pytest.mark.parametrize("stored,requested,page_size,can_list", [
+  # dense: every requested key exists
+  (range(0, 200), range(0, 200), 1000, True),
+  # sparse: half the requested keys are missing
+  (range(0, 200, 2), range(0, 200), 1000, True),
+  # the range is much denser than the request: HEAD what listing didn't reach
+  (range(0, 5000), range(0, 5000, 50), 1000, True),
+  # several pages
+  (range(0, 300), range(0, 300, 3), 25, True),
+  # no s3:ListBucket permission
+  (range(0, 100, 2), range(0, 100), 1000, False),
+  # too few keys to list
+  (range(0, 10), range(5, 15), 1000, True),
+])
+def test_s3_files_exist(stub_s3, stored, requested, page_size, can_list):
+  fmt = 'dataset/layer/chunk_{:05d}'
+  client = stub_s3(StubS3Client(
+    [ fmt.format(i) for i in stored ] + [ 'dataset/other/chunk_00001' ], 
+    page_size=page_size, can_list=can_list
+  ))
+
+  paths = [ 'chunk_{:05d}'.format(i) for i in requested ]
+  with SimpleStorage(S3_STUB_LAYER) as s:
+    results = s.files_exist(paths)
+
+  stored = set(stored)
+  assert results == { 
+    'chunk_{:05d}'.format(i): (i in stored) for i in requested 
+  }
+
+  listings = client.calls.count('list_objects_v2')
+  if len(paths) < 32:
+    assert listings == 0
+  else:
+    assert 1 <= listings <= len(paths) // 32
+
+  if not can_list:
+    assert listings == 1
+    assert client.calls.count('head_object') == len(paths)
+
+def test_s3_delete_files(stub_s3):
+  fmt = 'dataset/layer/chunk_{:05d}'
+  failing = [ fmt.format(7), fmt.format(1500) ]
+  client = stub_s3(StubS3Client(
+    [ fmt.format(i) for i in range(2500) ], failing_deletes=failing
+  ))
+
+  with SimpleStorage(S3_STUB_LAYER) as s:
+    s.delete_files([ 'chunk_{:05d}'.format(i) for i in range(2500) ])
+
+  assert [ c for c in client.calls if c != 'delete_object' ] == [ 1000, 1000, 500 ]
+  assert client.calls.count('delete_object') == len(failing)
+  assert len(client.keys) == 0
+
+def test_s3_threaded_files_exist_lists(stub_s3):
+  fmt = 'dataset/layer/chunk_{:05d}'
+  client = stub_s3(StubS3Client([ fmt.format(i) for i in range(1000) ]))
+
+  paths = [ 'chunk_{:05d}'.format(i) for i in range(1000) ]
+  with Storage(S3_STUB_LAYER, n_threads=20) as s:
+    results = s.files_exist(paths)
+
+  assert all(results.values()) and len(results) == 1000
+  # worker blocks are large enough to be listed rather than HEADed,
+  # only a short final block may fall back to HEAD
+  assert client.calls.count('head_object') < 32